@@ -17,6 +17,7 @@ import hyoga
 # initialize figure
 ax = plt.subplot()
 cax = plt.axes([0.15, 0.55, 0.025, 0.25])
+levels = [10**i for i in range(-9, 1)]
 
 # open demo data
 with hyoga.open.example('pism.alps.out.2d.nc') as ds:
@@ -25,10 +26,9 @@ with hyoga.open.example('pism.alps.out.2d.nc') as ds:
     ds.hyoga.plot.bedrock_altitude(ax=ax, center=False)
     ds.hyoga.plot.surface_altitude_contours(ax=ax)
     ds.hyoga.plot.bedrock_erosion(
-        ax=ax, cbar_ax=cax, levels=[10**i for i in range(-9, 1)],
-        cbar_kwargs=dict(
+        ax=ax, cbar_ax=cax, levels=levels, cbar_kwargs=dict(
             format=matplotlib.ticker.LogFormatterMathtext(),
-            ticks=[10**i for i in range(-9, 1, 3)]))
+            ticks=levels[::3]))
     ds.hyoga.plot.ice_margin(ax=ax)
 
     # add coastline and rivers
@@ -9,10 +9,22 @@ Hyoga logo
 Plot hyoga logo and favicon and including glaciers and paleoglaciers.
 """
 
+import functools
 import matplotlib.pyplot as plt
 import hyoga
 
 
+@functools.lru_cache
+def get_geometries(crs):
+    """Return continents, paleoglaciers and glaciers reprojected once."""
+    return (
+        hyoga.open.natural_earth(
+            'admin_0_countries', category='cultural', scale='110m'
+            ).to_crs(crs),
+        hyoga.open.paleoglaciers('ehl11').to_crs(crs),
+        hyoga.open.natural_earth('glaciated_areas', scale='50m').to_crs(crs))
+
+
 def get_height_dots(fig):
     """Return the figure height in dots."""
     return fig.get_window_extent().height/fig.dpi*72
@@ -27,13 +39,10 @@ def plot_favicon(figsize=None, rect=None, color='0.25'):
 
     # add continents and glaciers
     crs = '+a=6378137 +proj=ortho +lon_0=-45 +lat_0=90'
-    hyoga.open.natural_earth(
-        'admin_0_countries', category='cultural', scale='110m')\
-        .to_crs(crs).plot(ax=ax, alpha=0.25, facecolor=color)
-    hyoga.open.paleoglaciers('ehl11').to_crs(crs).plot(
-        ax=ax, alpha=0.75, facecolor=color)
-    hyoga.open.natural_earth('glaciated_areas', scale='50m').to_crs(crs).plot(
-        ax=ax, edgecolor=color, facecolor=color)
+    countries, paleoglaciers, glaciers = get_geometries(crs)
+    countries.plot(ax=ax, alpha=0.25, facecolor=color)
+    paleoglaciers.plot(ax=ax, alpha=0.75, facecolor=color)
+    glaciers.plot(ax=ax, edgecolor=color, facecolor=color)
 
     # add circle for the o
     ax.add_patch(plt.Circle(
@@ -20,12 +20,12 @@ ax = plt.subplot()
 with hyoga.open.example('pism.alps.out.2d.nc') as ds:
     ds.hyoga.plot.bedrock_altitude(ax=ax, vmin=0)
 
-    # plot canonical Natural Earth background
-    ds.hyoga.plot.natural_earth(ax=ax)
-
     # get dataset crs, we need this
     crs = ds.proj4
 
+# plot canonical Natural Earth background (only needs dataset crs)
+ds.hyoga.plot.natural_earth(ax=ax)
+
 # lock axes extent
 ax.set_autoscale_on(False)
 
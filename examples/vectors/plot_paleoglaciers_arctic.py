@@ -14,7 +14,9 @@ import matplotlib.pyplot as plt
 import hyoga
 
 # plot natural earth land
-gdf = hyoga.open.natural_earth('land', scale='50m').to_crs('epsg:3995')
+# read lands north of 20 degrees, the lowest latitude in the map extent
+gdf = hyoga.open.natural_earth('land', scale='50m', bbox=(-180, 20, 180, 90))
+gdf = gdf.to_crs('epsg:3995')
 ax = gdf.plot(color='0.9')
 
 # plot paleoglaciers
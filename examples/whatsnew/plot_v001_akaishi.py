@@ -11,14 +11,18 @@ import matplotlib.pyplot as plt
 import contextily as cx
 import hyoga
 
-# plot paleoglaciers
-ax = hyoga.open.paleoglaciers().to_crs(epsg=3857).plot(
-    alpha=0.75, facecolor='tab:blue', edgecolor='tab:blue', linewidth=2)
-
 # zoom on Akaishi Mountains
+ax = plt.subplot()
 ax.set_xlim(15330e3, 15450e3)
 ax.set_ylim(4200e3, 4290e3)
 
+# plot paleoglaciers within map extent
+gdf = hyoga.open.paleoglaciers().to_crs(epsg=3857)
+gdf = gdf.cx[15330e3:15450e3, 4200e3:4290e3]
+gdf.plot(
+    ax=ax, alpha=0.75, facecolor='tab:blue', edgecolor='tab:blue',
+    linewidth=2)
+
 # add stamen terrain
 cx.add_basemap(ax, source=cx.providers.Esri.WorldShadedRelief)
 
@@ -11,14 +11,18 @@ import matplotlib.pyplot as plt
 import contextily as cx
 import hyoga
 
-# plot paleoglaciers
-ax = hyoga.open.paleoglaciers().to_crs(epsg=3857).plot(
-    alpha=0.75, facecolor='tab:blue', edgecolor='tab:blue', linewidth=2)
-
 # zoom on Cocuy (240x180 km)
+ax = plt.subplot()
 ax.set_xlim(-8200e3, -7960e3)
 ax.set_ylim(580e3, 760e3)
 
+# plot paleoglaciers within map extent
+gdf = hyoga.open.paleoglaciers().to_crs(epsg=3857)
+gdf = gdf.cx[-8200e3:-7960e3, 580e3:760e3]
+gdf.plot(
+    ax=ax, alpha=0.75, facecolor='tab:blue', edgecolor='tab:blue',
+    linewidth=2)
+
 # add stamen terrain
 cx.add_basemap(ax, source=cx.providers.Esri.WorldShadedRelief)
 
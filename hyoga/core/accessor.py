@@ -8,16 +8,80 @@ masking and interpolation. This functionality is made available through an
 xarray dataset accessor. Plotting methods are kept in a separate module.
 """
 
+import functools
+import os
+import types
 import warnings
 import geopandas
 import numpy as np
 import scipy.ndimage
+import scipy.signal
 import xarray as xr
 import cf_xarray  # noqa pylint: disable=unused-import
 
 import hyoga.plot.datasets
 
 
+# standard names for old PISM files, by short name
+_PISM_STANDARD_NAMES = types.MappingProxyType({
+    'topg':         'bedrock_altitude',
+    'uvelbase':     'land_ice_basal_x_velocity',
+    'vvelbase':     'land_ice_basal_y_velocity',
+    'uvelsurf':     'land_ice_surface_x_velocity',
+    'vvelsurf':     'land_ice_surface_y_velocity',
+    'thk':          'land_ice_thickness',
+    'velbase_mag':  'magnitude_of_land_ice_basal_velocity',
+    'velsurf_mag':  'magnitude_of_land_ice_surface_velocity',
+    'usurf':        'surface_altitude'})
+
+# temporary workaround for scipy 1.10.0 issue 17718
+_SCIPY_ISSUE_17718 = scipy.__version__ == '1.10.0'
+
+# largest variable size in bytes cached when reading datasource files
+_DATASOURCE_CACHE_NBYTES = 2**26
+
+# attributes and units triggering variable decoding in xarray.decode_cf
+_CF_ENCODING_ATTRS = frozenset((
+    '_FillValue', 'missing_value', 'scale_factor', 'add_offset', '_Unsigned',
+    '_Encoding', 'calendar', 'coordinates', 'dtype'))
+_CF_TIMEDELTA_UNITS = frozenset((
+    'days', 'hours', 'minutes', 'seconds', 'milliseconds', 'microseconds',
+    'nanoseconds'))
+
+
+def _attrs_equal(value, other):
+    """Compare attribute values, element-wise if any of them is an array."""
+    if isinstance(value, np.ndarray) or isinstance(other, np.ndarray):
+        return np.array_equal(value, other)
+    return value == other
+
+
+def _gaussian_filter(data, sigma, truncate=4.0):
+    """Apply a gaussian filter, using FFT convolutions for large sigma."""
+
+    # direct convolution is faster for small kernels, and FFT convolution
+    # would spread any non-finite value over the entire rows and columns
+    if sigma < 16 or not np.isfinite(data).all():
+        return scipy.ndimage.gaussian_filter(
+            data, sigma=sigma, truncate=truncate)
+
+    # build normalized kernel truncated as in scipy.ndimage
+    radius = int(truncate*sigma+0.5)
+    kernel = np.exp(-0.5*(np.arange(-radius, radius+1)/sigma)**2)
+    kernel = (kernel/kernel.sum()).astype(data.dtype)
+
+    # convolve along each axis with symmetric padding ('reflect' in ndimage)
+    for axis in range(data.ndim):
+        pad = [(0, 0)] * data.ndim
+        pad[axis] = (radius, radius)
+        shape = [1] * data.ndim
+        shape[axis] = -1
+        data = scipy.signal.oaconvolve(
+            np.pad(data, pad, mode='symmetric'), kernel.reshape(shape),
+            mode='valid', axes=axis)
+    return data
+
+
 def _coords_from_axes(ax):
     """Compute coordinate vectors from matplotlib axes."""
     bbox = ax.get_window_extent()
@@ -35,26 +99,71 @@ def _coords_from_extent(extent, cols, rows):
     dx = (east-west) / cols
     dy = (north-south) / rows
 
-    # prepare coordinate vectors
-    xwcol = west + 0.5*dx  # x-coord of W row cell centers
-    ysrow = south + 0.5*dy  # y-coord of N row cell centers
-    x = xwcol + np.arange(cols)*dx  # from W to E
-    y = ysrow + np.arange(rows)*dy  # from S to N
+    # prepare coordinate vectors of cell centers
+    x = np.linspace(west+0.5*dx, east-0.5*dx, cols)  # from W to E
+    y = np.linspace(south+0.5*dy, north-0.5*dy, rows)  # from S to N
 
     # return coordinate vectors
     return x, y
 
 
+@functools.lru_cache(maxsize=4)
+def _load_datasource(path, mtime, standard_name):
+    """Load variable from file, cached by path and modification time.
+
+    Only variables stored in the file and smaller than _DATASOURCE_CACHE_NBYTES
+    are loaded. Otherwise None is returned, without inferring or loading data,
+    so that inferred variables follow configuration changes and at most four
+    small variables stay in memory."""
+    # pylint: disable=unused-argument
+    with xr.open_dataset(path) as ds:
+        try:
+            var = ds.hyoga.getvar(standard_name, infer=False)
+        except ValueError:
+            return None
+        if var.nbytes > _DATASOURCE_CACHE_NBYTES:
+            return None
+        return var.load()
+
+
 def _open_datasource(datasource, standard_name):
     """Get variable from dataset or file, or return data array."""
     if isinstance(datasource, xr.DataArray):
         return datasource
     if isinstance(datasource, xr.Dataset):
         return datasource.hyoga.getvar(standard_name)
+
+    # return a copy of cached data for small variables in local files
+    if isinstance(datasource, (str, os.PathLike)):
+        path = os.path.abspath(os.path.expanduser(datasource))
+        if os.path.isfile(path):
+            var = _load_datasource(
+                path, os.path.getmtime(path), standard_name)
+            if var is not None:
+                return var.copy()
+
+    # open anything else (urls, large or inferred variables, file-like,
+    # data store) directly
     with xr.open_dataset(datasource) as ds:
         return ds.hyoga.getvar(standard_name)
 
 
+def _needs_decoding(dataset):
+    """Check whether a dataset has any variable left to decode."""
+    if 'coordinates' in dataset.attrs:
+        return True
+    for var in dataset.variables.values():
+        units = var.attrs.get('units')
+        if isinstance(units, str) and (
+                ' since ' in units or units in _CF_TIMEDELTA_UNITS):
+            return True
+        if not _CF_ENCODING_ATTRS.isdisjoint(var.attrs):
+            return True
+        if var.dtype.kind in 'OST' or not var.dtype.isnative:
+            return True
+    return False
+
+
 @xr.register_dataset_accessor('hyoga')
 class HyogaDataset:
     """Hyoga extension to xarray datasets."""
@@ -65,7 +174,8 @@ class HyogaDataset:
     def __init__(self, dataset):
         """Initialize data accessor.
 
-        The accessed data set is decoded according to CF conventions, then
+        The accessed data set is decoded according to CF conventions (unless
+        already decoded, as by default in :func:`xarray.open_dataset`), then
         heuristics are used to try and fill missing standard names. This latter
         step is necessary to inform secondary coordinates referred in the
         'coordinates' attribute, otherwise `dataset.cf[standard_name]` may have
@@ -77,8 +187,12 @@ class HyogaDataset:
         dataset : Dataset on which the accessor is plugged.
         """
         # NOTE in the future we will decide here about age dim and units
-        self._ds = xr.decode_cf(dataset)
+        self._ds = dataset
+        if _needs_decoding(dataset):
+            self._ds = xr.decode_cf(dataset)
         self._ds = self._fill_standard_names()
+        self._associated = {}
+        self._inferred = {}
 
     def _fill_standard_names(self):
         """Add missing standard names in old PISM files.
@@ -86,22 +200,44 @@ class HyogaDataset:
         Currently this method only supports PISM. In the future other models
         will be supported, ideally detected using netCDF metadata, and
         otherwise through a keyword argument in hyoga.open methods."""
-        pism_names = {
-            'bedrock_altitude':                         'topg',
-            'land_ice_basal_x_velocity':                'uvelbase',
-            'land_ice_basal_y_velocity':                'vvelbase',
-            'land_ice_surface_x_velocity':              'uvelsurf',
-            'land_ice_surface_y_velocity':              'uvelsurf',
-            'land_ice_thickness':                       'thk',
-            'magnitude_of_land_ice_basal_velocity':     'velbase_mag',
-            'magnitude_of_land_ice_surface_velocity':   'velsurf_mag',
-            'surface_altitude':                         'usurf'}
         ds = self._ds
-        for standard_name, name in pism_names.items():
-            if name in self._ds and 'standard_name' not in ds[name].attrs:
-                ds[name] = ds[name].assign_attrs(standard_name=standard_name)
+        missing = [
+            name for name in _PISM_STANDARD_NAMES.keys() & ds.variables.keys()
+            if 'standard_name' not in ds.variables[name].attrs]
+
+        # shallow copy copies attrs, leaving the original dataset untouched
+        if missing:
+            ds = ds.copy()
+            for name in missing:
+                ds.variables[name].attrs.update(
+                    standard_name=_PISM_STANDARD_NAMES[name])
         return ds
 
+    @functools.cached_property
+    def _bedrock(self):
+        """Names of variables whose standard name starts with bedrock."""
+        return frozenset(
+            name for name, var in self._ds.items() if var.attrs.get(
+                'standard_name', '').startswith('bedrock_altitude'))
+
+    @functools.cached_property
+    def _names(self):
+        """Map unique data variable standard names to short names.
+
+        Standard names shared by several variables are left out, so that
+        ambiguous lookups still go through (and fail in) cf_xarray."""
+        names = {}
+        duplicates = set()
+        for name, var in self._ds.data_vars.items():
+            standard_name = var.attrs.get('standard_name')
+            if standard_name in names:
+                duplicates.add(standard_name)
+            elif standard_name is not None:
+                names[standard_name] = name
+        for standard_name in duplicates:
+            del names[standard_name]
+        return names
+
     def _safe_apply(self, func, *standard_names, **kwargs):
         """Apply a function to a list of variables after checking units."""
 
@@ -111,16 +247,22 @@ class HyogaDataset:
         assert all(var.attrs.get('units') == units for var in variables)
 
         # compute new variable and assign common attributes
-        # (np.all is necessary for arrays but also works on non-arrays)
+        # (only compare values of keys present in all variables, and skip
+        # variables sharing the same attributes dictionary)
+        first, *others = variables
+        others = [var for var in others if var.attrs is not first.attrs]
+        common = set(first.attrs).intersection(
+            *(var.attrs for var in others))
         attrs = {
-            k: v for k, v in variables[0].attrs.items() if
-            all(np.all(var.attrs[k] == v) for var in variables)}
+            k: v for k, v in first.attrs.items() if k in common and
+            all(_attrs_equal(var.attrs[k], v) for var in others)}
         return func(variables).assign_attrs(**attrs)
 
     def _safe_mag(self, *args, **kwargs):
         """Compute the magnitude of several variables if units match."""
         return self._safe_apply(
-            lambda l: sum(v**2 for v in l)**0.5, *args, **kwargs)
+            lambda l: functools.reduce(np.hypot, l[1:], abs(l[0])),
+            *args, **kwargs)
 
     def _safe_sub(self, *args, **kwargs):
         """Compute the sum of several variables if units match."""
@@ -155,6 +297,11 @@ class HyogaDataset:
         # create an empty dict to store variables by short name
         variables = {}
 
+        # map standard names to the first matching existing variable
+        existing = {}
+        for name, var in self._ds.items():
+            existing.setdefault(var.attrs.get('standard_name', ''), name)
+
         # read data from source if it is not already an array
         for standard_name, datasource in standard_variables.items():
             data = _open_datasource(datasource, standard_name)
@@ -164,12 +311,9 @@ class HyogaDataset:
             variable_name = data.name or standard_name
 
             # look for existing variable with given standard name
-            variable_found = False
-            for name, var in self._ds.items():
-                if var.attrs.get('standard_name', '') == standard_name:
-                    variable_name = name
-                    variable_found = True
-                    break
+            variable_found = standard_name in existing
+            if variable_found:
+                variable_name = existing[standard_name]
 
             # if variable_name is present, but matches a different standard
             # name, add trailing underscores until we find a free slot
@@ -241,6 +385,47 @@ class HyogaDataset:
             bedrock_altitude_change_due_to_isostatic_adjustment=diff.rename(
                 name))
 
+    def _infer(self, standard_name, directions=None):
+        """Compute a missing variable from others, or return None."""
+
+        # try to get ice mask from ice thickness
+        if standard_name == 'land_ice_area_fraction':
+            return (
+                self.getvar('land_ice_thickness') >=
+                hyoga.config.glacier_masking_point
+            ).astype(float).assign_attrs(standard_name=standard_name)
+
+        # try to compute altitude and thickness variables
+        # (infer=False is needed to avoid infinite recursion)
+        if standard_name == 'bedrock_altitude':
+            return self._safe_sub(
+                'surface_altitude', 'land_ice_thickness', infer=False
+            ).assign_attrs(standard_name=standard_name)
+        if standard_name == 'land_ice_thickness':
+            return self._safe_sub(
+                'surface_altitude', 'bedrock_altitude', infer=False
+            ).assign_attrs(standard_name=standard_name)
+        if standard_name == 'surface_altitude':
+            return self._safe_sum(
+                'bedrock_altitude', 'land_ice_thickness', infer=False
+            ).assign_attrs(standard_name=standard_name)
+
+        # try to get the magnitude of a vector from its components
+        if standard_name.startswith('magnitude_of_'):
+            vector = standard_name.replace('magnitude_of_', '', 1)
+            directions = directions or ('upward', 'downward', 'x', 'y')
+            suffixes = ['_'+d for d in directions]
+            components = [
+                var.attrs['standard_name'] for var in self._ds.values() if
+                any(var.attrs.get('standard_name', '').replace(s, '') ==
+                    vector for s in suffixes)]
+            if len(components) > 0:
+                return self._safe_mag(*components).assign_attrs(
+                    standard_name=standard_name)
+
+        # no inference recipe matched
+        return None
+
     def getvar(self, standard_name, infer=True, directions=None):
         """Get a variable by conventional standard name.
 
@@ -271,47 +456,32 @@ class HyogaDataset:
             with that standard name has been found.
         """
 
-        # if variable is present, return it
+        # if variable is present, return it with the same associated
+        # coordinates (grid mapping, cell measures, ancillary variables) as
+        # cf_xarray, looked up once per variable
+        if standard_name in self._names:
+            name = self._names[standard_name]
+            var = self._ds[name]
+            if name not in self._associated:
+                self._associated[name] = [
+                    coord for coord in self._ds.cf[standard_name].coords
+                    if coord not in var.coords]
+            return var.assign_coords({
+                coord: self._ds.variables[coord]
+                for coord in self._associated[name]})
         if standard_name in self._ds.cf:
             return self._ds.cf[standard_name]
 
         # no variable found, try to compute it from other variables
+        # (memoized, also depending on the global glacier masking point, and
+        # returning copies so that in-place edits cannot alter the memo)
         if infer is True:
-
-            # try to get ice mask from ice thickness
-            if standard_name == 'land_ice_area_fraction':
-                return (
-                    self.getvar('land_ice_thickness') >=
-                    hyoga.config.glacier_masking_point
-                ).astype(float).assign_attrs(standard_name=standard_name)
-
-            # try to compute altitude and thickness variables
-            # (infer=False is needed to avoid infinite recursion)
-            if standard_name == 'bedrock_altitude':
-                return self._safe_sub(
-                    'surface_altitude', 'land_ice_thickness', infer=False
-                ).assign_attrs(standard_name=standard_name)
-            if standard_name == 'land_ice_thickness':
-                return self._safe_sub(
-                    'surface_altitude', 'bedrock_altitude', infer=False
-                ).assign_attrs(standard_name=standard_name)
-            if standard_name == 'surface_altitude':
-                return self._safe_sum(
-                    'bedrock_altitude', 'land_ice_thickness', infer=False
-                ).assign_attrs(standard_name=standard_name)
-
-            # try to get the magnitude of a vector from its components
-            if standard_name.startswith('magnitude_of_'):
-                vector = standard_name.replace('magnitude_of_', '', 1)
-                directions = directions or ('upward', 'downward', 'x', 'y')
-                components = [
-                    var.attrs['standard_name'] for var in self._ds.values() if
-                    vector in [
-                        var.attrs.get('standard_name', '').replace('_'+d, '')
-                        for d in directions]]
-                if len(components) > 0:
-                    return self._safe_mag(*components).assign_attrs(
-                        standard_name=standard_name)
+            key = (standard_name, tuple(directions or ()),
+                   hyoga.config.glacier_masking_point)
+            if key not in self._inferred:
+                self._inferred[key] = self._infer(standard_name, directions)
+            if self._inferred[key] is not None:
+                return self._inferred[key].copy()
 
         # really nothing worked, give up
         raise ValueError(
@@ -363,28 +533,40 @@ class HyogaDataset:
 
         # try to smooth integer-precision steps
         if sigma is not None:
-            dx = (x[-1]-x[0])/(len(x)-1)
-            dy = (y[-1]-y[0])/(len(y)-1)
+            dx = float(x[-1]-x[0])/(len(x)-1)
+            dy = float(y[-1]-y[0])/(len(y)-1)
             assert abs(dy-dx) < 1e12
-            topo = topo.astype(float)  # convert to float
-            filt = scipy.ndimage.gaussian_filter(topo, sigma=sigma/dx)
-            topo += np.clip(filt-topo, -0.5, 0.5)
-
-        # make sure surface altitude is present, needed for a nice mask
+            # convert integers to single precision, plenty for the 0.5 clip
+            data = topo.values.astype(np.result_type(topo.dtype, np.float32))
+            filt = _gaussian_filter(data, sigma=sigma/dx)
+            filt -= data  # reuse filter output as scratch
+            data += np.clip(filt, -0.5, 0.5, out=filt)
+            topo = topo.copy(data=data)
+
+        # make sure surface altitude is present, needed for a nice mask, and
+        # ice mask is present and has numeric type (single precision is
+        # plenty for a fraction and halves interp cost)
         # NOTE: add a wrapper something like ensure_var, maybe setvar?
+        icemask = self.getvar('land_ice_area_fraction')
         ds = self.assign(
-            surface_altitude=self.getvar('surface_altitude').rename('usurf'))
-
-        # make sure ice mask is present and has numeric type
-        icemask = ds.hyoga.getvar('land_ice_area_fraction')
-        ds = ds.hyoga.assign_icemask(icemask.astype(float))
-
-        # interpolate data variables and assign new topo
-        ds = ds.interp(x=x, y=y)
+            surface_altitude=self.getvar('surface_altitude').rename('usurf'),
+            land_ice_area_fraction=icemask.astype(np.float32).rename(
+                'icemask'))
+
+        # interpolate data variables unless already on the same grid, then
+        # only convert numeric horizontal variables to float as interp would
+        if np.array_equal(ds.x, x) and np.array_equal(ds.y, y):
+            ds = ds.assign_coords(x=x, y=y)
+            ds = ds.assign({
+                name: var.astype(float) for name, var in ds.data_vars.items()
+                if var.dtype.kind in 'iuf' and {'x', 'y'} & set(var.dims)})
+        else:
+            ds = ds.interp(x=x, y=y)
 
-        # correct for isostasy if it is present
+        # correct for isostasy if it is present (not in place, as topo may
+        # be the input data array)
         try:
-            topo += ds.hyoga.getvar(
+            topo = topo + ds.hyoga.getvar(
                 'bedrock_altitude_change_due_to_isostatic_adjustment')
         except ValueError:
             pass
@@ -394,7 +576,7 @@ class HyogaDataset:
 
         # refine ice mask based on interpolated surface
         icemask = ds.hyoga.getvar('land_ice_area_fraction')
-        icemask *= ds.hyoga.getvar('surface_altitude') > topo
+        icemask = icemask * (ds.hyoga.getvar('surface_altitude') > topo)
         ds = ds.hyoga.assign_icemask(icemask)
 
         # return interpolated data
@@ -436,8 +618,8 @@ class HyogaDataset:
             x, y = datasource.squeeze().geometry.coords.xy
 
         # compute distance along profile
-        dist = ((np.diff(x)**2+np.diff(y)**2)**0.5).cumsum()
-        dist = np.insert(dist, 0, 0)
+        dist = np.zeros(len(x))
+        np.cumsum(np.hypot(np.diff(x), np.diff(y)), out=dist[1:])
 
         # build coordinate xarrays
         x = xr.DataArray(x, coords=[dist], dims='d')
@@ -451,7 +633,7 @@ class HyogaDataset:
 
         # temporary workaround for scipy 1.10.0 issue 17718
         ds = self._ds
-        if scipy.__version__ == "1.10.0":
+        if _SCIPY_ISSUE_17718:
             x_dtype = x.dtype
             y_dtype = y.dtype
             x = x.astype('float64')
@@ -462,7 +644,7 @@ class HyogaDataset:
         ds = ds.interp(x=x, y=y, method='linear', assume_sorted=True)
 
         # return to original precision (scipy 1.10.0 issue 17718)
-        if scipy.__version__ == "1.10.0":
+        if _SCIPY_ISSUE_17718:
             x = x.astype(x_dtype)
             y = y.astype(y_dtype)
             for var in ds:
@@ -493,12 +675,11 @@ class HyogaDataset:
             Corresponing dataset with variables whose standard name does not
             start with "bedrock_altitude" filtered by the condition.
         """
-        ds = self._ds.copy()
-        for name, var in ds.items():
-            if not var.attrs.get(
-                    'standard_name', '').startswith('bedrock_altitude'):
-                ds[name] = var.where(cond, **kwargs)
-        return ds
+        # mask all glacier variables in a single dataset operation
+        names = [name for name in self._ds.data_vars
+                 if name not in self._bedrock]
+        return self._ds.assign(
+            self._ds[names].where(cond, **kwargs).data_vars)
 
     def where_icemask(self, threshold=0.5, **kwargs):
         """Filter glacier (non-bedrock) variables using existing ice mask.
@@ -137,17 +137,16 @@ class CW5E5TiledAggregator(TiledAggregator):
         """Return paths of input files, downloading as necessary."""
         variable, start, end = args
         downloader = hyoga.open.downloader.CW5E5DailyDownloader()
-        paths = [
-            downloader(variable, year, month)
-            for month in range(1, 13) for year in range(start, end+1)]
+        paths = downloader.map(
+            (variable, year, month)
+            for month in range(1, 13) for year in range(start, end+1))
         return paths
 
     def pattern(self, *args):
         variable, start, end = args
-        xdg_cache = os.environ.get("XDG_CACHE_HOME", os.path.join(
-            os.path.expanduser('~'), '.cache'))
         return os.path.join(
-            xdg_cache, 'hyoga', 'cw5e5', 'clim', f'cw5e5.{variable}.mon.'
+            hyoga.open.downloader.get_cache_dir(), 'cw5e5', 'clim',
+            f'cw5e5.{variable}.mon.'
             f'{start % 100:02d}{end % 100:02d}.avg.{{}}.nc')
 
     def aggregate(self, inputs, output, recipe='avg'):
@@ -8,9 +8,68 @@ or several files from the web, store them in hyoga's cache directory, and
 return a path to that file, or to the main file.
 """
 
+import concurrent.futures
+import functools
 import os.path
+import tempfile
 import zipfile
 import requests
+import requests.adapters
+
+# default number of concurrent downloads and connections per host
+_MAX_WORKERS = 8
+
+
+def get_cache_dir():
+    """Return hyoga's cache directory, respecting XDG_CACHE_HOME.
+
+    Returns
+    -------
+    path : str
+        The path to hyoga's cache directory, where downloaded and aggregated
+        files are stored.
+    """
+    xdg_cache = os.environ.get("XDG_CACHE_HOME", os.path.join(
+        os.path.expanduser('~'), '.cache'))
+    return os.path.join(xdg_cache, 'hyoga')
+
+
+def _write_validator(response, metapath):
+    """Store response entity tag or modification date to resume downloads."""
+    # weak entity tags are not allowed in If-Range headers
+    validator = response.headers.get('ETag')
+    if validator is None or validator.startswith('W/'):
+        validator = response.headers.get('Last-Modified')
+    if validator:
+        with open(metapath, 'w', encoding='utf-8') as metafile:
+            metafile.write(validator)
+    elif os.path.isfile(metapath):
+        os.remove(metapath)
+
+
+def _extract_members(archive, members, outdir):
+    """Extract archive members to a temporary directory, then move them."""
+    with tempfile.TemporaryDirectory(dir=outdir) as tmpdir:
+        archive.extractall(path=tmpdir, members=members)
+        for member in members:
+            path = os.path.join(outdir, member)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(os.path.join(tmpdir, member), path)
+
+
+@functools.cache
+def _get_session():
+    """Return a shared session retrying on server and connection errors."""
+    # keep raising http errors from raise_for_status when retries run out
+    retry = requests.adapters.Retry(
+        total=5, backoff_factor=0.5, status_forcelist=(502, 503, 504),
+        raise_on_status=False)
+    adapter = requests.adapters.HTTPAdapter(
+        max_retries=retry, pool_maxsize=_MAX_WORKERS)
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
 
 
 class Downloader:
@@ -24,6 +83,8 @@ class Downloader:
     * :meth:`check`: check whether file is present or valid.
     * :meth:`get`: actually download file (and any meta file).
 
+    Several files can be downloaded concurrently using :meth:`map`.
+
     Call parameters
     ---------------
     url : str
@@ -55,6 +116,34 @@ class Downloader:
             self.get(url, path, **kwargs)
         return path
 
+    def map(self, arglist, max_workers=_MAX_WORKERS, **kwargs):
+        """Download several files concurrently and return their paths.
+
+        Parameters
+        ----------
+        arglist : iterable
+            Tuples of positional arguments, each passed to a separate call.
+            Calls should not write to the same local paths.
+        max_workers : int, optional
+            Maximum number of concurrent downloads, default to 8. Larger
+            values are capped to 8, the connection pool size of the session
+            shared between downloads.
+        **kwargs :
+            Keyword arguments passed to every call.
+
+        Returns
+        -------
+        paths : list
+            The local paths of the downloaded files, in input order.
+        """
+
+        # download files concurrently, within the shared connection pool size
+        max_workers = min(max_workers, _MAX_WORKERS)
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            futures = [
+                executor.submit(self, *args, **kwargs) for args in arglist]
+            return [future.result() for future in futures]
+
     def url(self, *args):
         """Return url of file to download."""
         return args[0]
@@ -68,20 +157,54 @@ class Downloader:
         return os.path.isfile(path)
 
     def get(self, url, path):
-        """Download online `url` to local `path`."""
+        """Download online `url` to local `path`, resuming partial files."""
 
         # create directory if missing
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
-        # open url and raise any http error
-        with requests.get(url, stream=True, timeout=5) as request:
-            request.raise_for_status()
-
-            # download file chunks
-            print(f"downloading {url}...")
-            with open(path, 'wb') as binaryfile:
-                for chunk in request.iter_content(chunk_size=1024**2):
-                    binaryfile.write(chunk)
+        # resume from any partial download with a validator, unless changed
+        # online, and ask for unencoded data, so that partial file size is a
+        # byte offset (without validator, partial files are overwritten)
+        partpath = path + '.part'
+        metapath = partpath + '.validator'
+        while True:
+            offset = 0
+            headers = {'Accept-Encoding': 'identity'}
+            if os.path.isfile(partpath) and os.path.isfile(metapath):
+                offset = os.path.getsize(partpath)
+                with open(metapath, encoding='utf-8') as metafile:
+                    headers.update({
+                        'Range': f'bytes={offset}-',
+                        'If-Range': metafile.read()})
+
+            # open url and raise any http error
+            with _get_session().get(
+                    url, headers=headers, stream=True, timeout=5) as request:
+
+                # partial file is invalid, start over
+                if offset and request.status_code == 416:
+                    os.remove(partpath)
+                    continue
+                request.raise_for_status()
+
+                # server may ignore range or send a newer file, start over
+                if request.status_code != 206:
+                    offset = 0
+                    _write_validator(request, metapath)
+
+                # download file chunks
+                print(f"{'resuming' if offset else 'downloading'} {url}...")
+                with open(partpath, 'ab' if offset else 'wb') as binaryfile:
+                    for chunk in request.iter_content(chunk_size=1024**2):
+                        binaryfile.write(chunk)
+
+            # download complete
+            break
+
+        # move complete file into place
+        os.replace(partpath, path)
+        if os.path.isfile(metapath):
+            os.remove(metapath)
 
 
 class CacheDownloader(Downloader):
@@ -97,9 +220,7 @@ class CacheDownloader(Downloader):
 
     def path(self, *args):
         path = super().path(*args)
-        xdg_cache = os.environ.get("XDG_CACHE_HOME", os.path.join(
-            os.path.expanduser('~'), '.cache'))
-        return os.path.join(xdg_cache, 'hyoga', path)
+        return os.path.join(get_cache_dir(), path)
 
 
 class CW5E5DailyDownloader(CacheDownloader):
@@ -200,7 +321,7 @@ class ZipDownloader(ArchiveDownloader):
 
     def deflate(self, archivepath, member, outdir):
         with zipfile.ZipFile(archivepath, 'r') as archive:
-            archive.extract(member, path=outdir)
+            _extract_members(archive, [member], outdir)
 
 
 class ShapeZipDownloader(ArchiveDownloader):
@@ -226,8 +347,8 @@ class ShapeZipDownloader(ArchiveDownloader):
     def deflate(self, archivepath, member, outdir):
         stem, ext = os.path.splitext(member)
         with zipfile.ZipFile(archivepath, 'r') as archive:
-            for ext in self.extensions:
-                archive.extract(stem+ext, path=outdir)
+            _extract_members(
+                archive, [stem+ext for ext in self.extensions], outdir)
 
 
 class NaturalEarthDownloader(ShapeZipDownloader):
@@ -265,9 +386,7 @@ class NaturalEarthDownloader(ShapeZipDownloader):
             return cartopy_stem + '.shp'
 
         # otherwise return path relative to hyoga cache
-        xdg_cache = os.environ.get("XDG_CACHE_HOME", os.path.join(
-            os.path.expanduser('~'), '.cache'))
         path = os.path.join(
-            xdg_cache, 'hyoga', 'natural_earth', f'{scale}_{category}',
+            get_cache_dir(), 'natural_earth', f'{scale}_{category}',
             f'ne_{scale}_{theme}.shp')
         return path
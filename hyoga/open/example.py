@@ -15,8 +15,24 @@ import xarray as xr
 import hyoga.open.downloader
 
 
-def example(filename='pism.alps.out.2d.nc'):
-    """Open cached example dataset from hyoga-data github repository."""
+def example(filename='pism.alps.out.2d.nc', **kwargs):
+    """Open cached example dataset from hyoga-data github repository.
+
+    Parameters
+    ----------
+    filename : str, optional
+        Name of the example file to open, either a netCDF file (``.nc``) or
+        a shapefile (``.shp``), defaults to ``'pism.alps.out.2d.nc'``.
+    **kwargs : optional
+        Keyword arguments passed to :func:`xarray.open_dataset` for netCDF
+        files (e.g. ``chunks={}`` for dask-backed lazy loading), or to
+        :func:`geopandas.read_file` for shapefiles.
+
+    Returns
+    -------
+    ds : Dataset or GeoDataFrame
+        The example dataset or geodataframe.
+    """
 
     # github repo url
     repo = 'https://raw.githubusercontent.com/juseg/hyoga-data/main'
@@ -26,14 +42,14 @@ def example(filename='pism.alps.out.2d.nc'):
         model = filename.split('.')[0]
         url = '/'.join((repo, model, filename))
         path = hyoga.open.downloader.CacheDownloader()(url, filename)
-        return xr.open_dataset(path)
+        return xr.open_dataset(path, **kwargs)
 
     # open shapefiles with geopandas
     if filename.endswith('.shp'):
         url = '/'.join((repo, 'shp', os.path.splitext(filename)[0] + '.zip'))
         path = os.path.join('examples', 'shp', filename)
         path = hyoga.open.downloader.ShapeZipDownloader()(url, path, filename)
-        return geopandas.read_file(path)
+        return geopandas.read_file(path, **kwargs)
 
     # raise error for anything else
     raise ValueError(f'Could not recognized format for {filename}.')
@@ -17,6 +17,12 @@ import xarray as xr
 # Private methods
 # ---------------
 
+# keyword arguments only understood by xarray.open_mfdataset
+_MFDATASET_OPTIONS = (
+    'attrs_file', 'combine', 'combine_attrs', 'compat', 'concat_dim', 'coords',
+    'data_vars', 'join', 'parallel')
+
+
 def _preprocess(ds):
     """Prepare a newly opened dataset for convenient plotting."""
     # NOTE this may be moved to the accessor init in the future
@@ -77,8 +83,20 @@ def mfdataset(filename, **kwargs):
     **kwargs : optional
         Keyword arguments passed :func:`xarray.open_mfdataset`. By default
         global attributes will be read from the last file (preserving history
-        from a series of runs) and a ``'minimal'`` set of data variables (not
-        including lon, lat, etc) will be concatenated across files.
+        from a series of runs), a ``'minimal'`` set of data variables (not
+        including lon, lat, etc) will be concatenated across files, variables
+        not concatenated will be read from the first file without comparing
+        them across files, files will be opened in parallel, and data will
+        be split in chunks of one time slice.
+
+    Notes
+    -----
+    If ``filename`` resolves to a single file path and none of the combining
+    options of :func:`xarray.open_mfdataset` (``combine``, ``concat_dim``,
+    ``combine_attrs``, etc.) are passed, the file is opened directly using
+    :func:`xarray.open_dataset`, applying any ``preprocess`` function and
+    using dask chunks as :func:`xarray.open_mfdataset` would, but skipping the
+    combining machinery.
 
     Returns
     -------
@@ -95,11 +113,33 @@ def mfdataset(filename, **kwargs):
 
     # get global attributes from last file (attrs_file)
     # do not concatenate lon, lat etc (data_vars='minimal')
+    # take them from the first file without checks (coords, compat)
+    # open files concurrently using dask delayed (parallel)
+    # only read needed time slices (chunks)
     options = dict(
         attrs_file=(filelist[-1] if filelist else None),
-        data_vars='minimal', decode_cf=False)
+        chunks={'time': 1}, data_vars='minimal', coords='minimal',
+        compat='override', decode_cf=False, parallel=True)
     options.update(**kwargs)
-    ds = xr.open_mfdataset(filename, **options)
+
+    # a single file needs no combining, open it directly (unless combining
+    # options were passed), using dask chunks as open_mfdataset would
+    if (len(filelist) == 1 and isinstance(filelist[0], (str, os.PathLike))
+            and kwargs.keys().isdisjoint(_MFDATASET_OPTIONS)):
+        preprocess = options.pop('preprocess', None)
+        for key in _MFDATASET_OPTIONS:
+            options.pop(key, None)
+        if options['chunks'] is None:
+            options['chunks'] = {}
+        ds = xr.open_dataset(filelist[0], **options)
+        if preprocess is not None:
+            ds = preprocess(ds)
+
+    # otherwise open and combine all files
+    else:
+        ds = xr.open_mfdataset(filename, **options)
+
+    # return preprocessed dataset
     ds = _preprocess(ds)
     return ds
 
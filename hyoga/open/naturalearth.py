@@ -8,12 +8,29 @@ glaciers, etc) elements. The data are returned as a geopandas GeoDataFrame
 instance, allowing convenient postprocessing and speedy plotting.
 """
 
+import functools
 import geopandas
 import pandas
 import hyoga.plot
 
 
-def natural_earth(theme, category='physical', scale='10m'):
+def _read_natural_earth(scale, category, theme, **kwargs):
+    """Download and read a single Natural Earth theme."""
+    downloader = hyoga.open.downloader.NaturalEarthDownloader()
+    filepath = downloader(scale, category, theme)
+    return geopandas.read_file(filepath, **kwargs)
+
+
+@functools.lru_cache(maxsize=10)
+def _read_natural_earth_cached(scale, category, theme):
+    """Download and read a single Natural Earth theme, cached in memory.
+
+    At most ten themes are kept, enough for the nine themes of the default
+    Natural Earth background plot."""
+    return _read_natural_earth(scale, category, theme)
+
+
+def natural_earth(theme, category='physical', scale='10m', **kwargs):
     """Open Natural Earth geodataframe
 
     Parameters
@@ -30,6 +47,11 @@ def natural_earth(theme, category='physical', scale='10m'):
     scale : {'10m', '50m', '110m'}, optional
         Natural Earth data scale controlling the level of detail, defaults to
         the highest scale of 10m.
+    **kwargs : optional
+        Additional keyword arguments are passed to
+        :func:`geopandas.read_file`, e.g. ``bbox`` to only read features
+        intersecting a lon-lat bounding box. Results are only cached in memory
+        if no keyword arguments are given.
 
     Returns
     -------
@@ -50,9 +72,12 @@ def natural_earth(theme, category='physical', scale='10m'):
     # if theme is iterable, call recursively
     if hasattr(theme, '__iter__') and not isinstance(theme, str):
         return pandas.concat(natural_earth(
-            subtheme, category=category, scale=scale) for subtheme in theme)
+            subtheme, category=category, scale=scale, **kwargs)
+            for subtheme in theme)
 
-    # otherwise, return geodataframe
-    downloader = hyoga.open.downloader.NaturalEarthDownloader()
-    filepath = downloader(scale, category, theme)
-    return geopandas.read_file(filepath)
+    # read any filtered subset directly from file
+    if kwargs:
+        return _read_natural_earth(scale, category, theme, **kwargs)
+
+    # otherwise, return a copy of the cached geodataframe
+    return _read_natural_earth_cached(scale, category, theme).copy()
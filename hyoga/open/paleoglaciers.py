@@ -7,6 +7,7 @@ datasets. The data are returned as a geopandas GeoDataFrame instance, allowing
 convenient postprocessing and speedy plotting.
 """
 
+import functools
 import geopandas
 import pandas
 
@@ -26,11 +27,12 @@ def _download_paleoglaciers_ehl11():
 def _download_paleoglaciers_bat19():
     """Download Batchelor et al. (2019) paleoglaciers, return cache path."""
     downloader = hyoga.open.downloader.OSFDownloader()
-    downloader('gzkwc', 'LGM_best_estimate.dbf')
-    downloader('xm6tu', 'LGM_best_estimate.prj')
-    downloader('9bjwn', 'LGM_best_estimate.shx')
-    filepath = downloader('9yhdv', 'LGM_best_estimate.shp')
-    return (filepath, )
+    paths = downloader.map((
+        ('gzkwc', 'LGM_best_estimate.dbf'),
+        ('xm6tu', 'LGM_best_estimate.prj'),
+        ('9bjwn', 'LGM_best_estimate.shx'),
+        ('9yhdv', 'LGM_best_estimate.shp')))
+    return (paths[-1], )
 
 
 def _download_paleoglaciers(source):
@@ -38,7 +40,29 @@ def _download_paleoglaciers(source):
     return globals()['_download_paleoglaciers_' + source]()
 
 
-def paleoglaciers(source='ehl11'):
+def _read_paleoglaciers(source, **kwargs):
+    """Download and read paleoglacier extent."""
+
+    # open paleoglacier shapefile(s)
+    paths = _download_paleoglaciers(source)
+    gdf = pandas.concat(geopandas.read_file(path, **kwargs) for path in paths)
+
+    # Ehlers et al. data need cleanup
+    # FIXME move to _paleoglaciers_ehl11
+    if source == 'ehl11':
+        gdf = gdf.drop_duplicates()
+
+    # return geodataframe
+    return gdf
+
+
+@functools.lru_cache(maxsize=2)
+def _read_paleoglaciers_cached(source):
+    """Download and read paleoglacier extent, cached in memory."""
+    return _read_paleoglaciers(source)
+
+
+def paleoglaciers(source='ehl11', **kwargs):
     """Open Last Glacial Maximum paleoglacier extent.
 
     Parameters
@@ -46,20 +70,21 @@ def paleoglaciers(source='ehl11'):
     source : 'ehl11' or 'bat19'
         Source of paleoglacier extent data, either Ehlers et al. (2011) or
         Batchelor et al. (2019).
+    **kwargs : optional
+        Additional keyword arguments are passed to
+        :func:`geopandas.read_file`, e.g. ``bbox`` to only read features
+        intersecting a bounding box in the source data crs. Results are only
+        cached in memory if no keyword arguments are given.
 
     Returns
     -------
     gdf : GeoDataFrame
         The geodataframe containing paleoglaciers geometries.
     """
-    # open paleoglacier shapefile(s)
-    paths = _download_paleoglaciers(source)
-    gdf = pandas.concat(geopandas.read_file(path) for path in paths)
 
-    # Ehlers et al. data need cleanup
-    # FIXME move to _paleoglaciers_ehl11
-    if source == 'ehl11':
-        gdf = gdf.drop_duplicates()
+    # read any filtered subset directly from file
+    if kwargs:
+        return _read_paleoglaciers(source, **kwargs)
 
-    # return geodataframe
-    return gdf
+    # otherwise, return a copy of the cached geodataframe
+    return _read_paleoglaciers_cached(source).copy()
@@ -62,7 +62,7 @@ def _open_climatology(source='chelsa', variable='tas'):
         basenames = (
             f'CHELSA_{variable}_{month+1:02d}_1981-2010_V.2.1.tif'
             for month in range(12))
-        paths = (downloader(
+        paths = downloader.map((
             'https://os.zhdk.cloud.switch.ch/envicloud/chelsa/chelsa_V2/'
             f'GLOBAL/climatologies/1981-2010/{variable}/{basename}',
             f'chelsa/{basename}') for basename in basenames)
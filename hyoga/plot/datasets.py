@@ -74,6 +74,21 @@ class HyogaPlotMethods:
         ax.xaxis.set_visible(False)
         ax.yaxis.set_visible(False)
 
+    # Geodataframe wrappers
+    # ---------------------
+
+    def _to_dataset_crs(self, gdf):
+        """Reproject geodataframe to dataset crs unless already equal."""
+
+        # get dataset crs (or proj4 attr for backward compat)
+        crs = self._ds.rio.crs or self._ds.proj4
+
+        # skip the per-geometry transform if crs are equivalent
+        if gdf.crs is not None and gdf.crs.equals(
+                crs, ignore_axis_order=True):
+            return gdf
+        return gdf.to_crs(crs)
+
     # Dataset plot methods
     # --------------------
 
@@ -450,7 +465,7 @@ class HyogaPlotMethods:
         mask = self._hyoga.getvar('land_ice_area_fraction') >= 0.5
         uvar = self._hyoga.getvar('land_ice_surface_x_velocity').where(mask)
         vvar = self._hyoga.getvar('land_ice_surface_y_velocity').where(mask)
-        cvar = (uvar**2+vvar**2)**0.5
+        cvar = np.hypot(uvar, vvar)
 
         # streamplot surface velocity
         return self._streamplot(
@@ -514,12 +529,9 @@ class HyogaPlotMethods:
         # TODO: open geopandas issue to allow gdf.plot(autolim=False)
         kwargs['ax'].set_autoscale_on(False)
 
-        # get dataset crs (or proj4 attr for backward compat)
-        crs = self._ds.rio.crs or self._ds.proj4
-
         # open natural earth data, reproject and plot
         gdf = hyoga.open.natural_earth(theme, category=category, scale=scale)
-        return gdf.to_crs(crs).plot(**kwargs)
+        return self._to_dataset_crs(gdf).plot(**kwargs)
 
     def paleoglaciers(self, source='ehl11', **kwargs):
         """Plot Last Glacial Maximum paleoglacier extent.
@@ -548,12 +560,9 @@ class HyogaPlotMethods:
         # TODO: open geopandas issue to allow gdf.plot(autolim=False)
         kwargs['ax'].set_autoscale_on(False)
 
-        # get dataset crs (or proj4 attr for backward compat)
-        crs = self._ds.rio.crs or self._ds.proj4
-
         # open paleoglaciers data, reproject and plot
         gdf = hyoga.open.paleoglaciers(source=source)
-        return gdf.to_crs(crs).plot(**kwargs)
+        return self._to_dataset_crs(gdf).plot(**kwargs)
 
     # Axes decorations
     # ----------------
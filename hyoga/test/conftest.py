@@ -0,0 +1,17 @@
+# Copyright (c) 2024, Julien Seguinot (juseg.dev)
+# GNU General Public License v3.0+ (https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+This module contains test fixtures shared across test modules.
+"""
+
+import pytest
+import requests
+import hyoga.open.downloader
+
+
+@pytest.fixture(autouse=True)
+def fixture_no_retries(monkeypatch):
+    """Fail fast on network errors instead of retrying downloads."""
+    monkeypatch.setattr(
+        hyoga.open.downloader, '_get_session', requests.Session)
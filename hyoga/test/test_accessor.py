@@ -0,0 +1,90 @@
+# Copyright (c) 2024, Julien Seguinot (juseg.dev)
+# GNU General Public License v3.0+ (https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+This module contains basic tests for accessor data methods.
+"""
+
+import numpy as np
+import xarray as xr
+import hyoga
+import hyoga.core.accessor
+
+
+def make_dataset():
+    """Make minimal dataset with ice thickness."""
+    return xr.Dataset(
+        coords={'x': [0., 1.], 'y': [0., 1.]},
+        data_vars={'thk': (
+            ['y', 'x'], np.array([[0.5, 2], [5, 0]]),
+            {'standard_name': 'land_ice_thickness'})})
+
+
+def test_assign_path_config_change(tmp_path, monkeypatch):
+    path = tmp_path / 'thk.nc'
+    make_dataset().to_netcdf(path)
+    ds = make_dataset().drop_vars('thk')
+    mask = ds.hyoga.assign(land_ice_area_fraction=path).hyoga.getvar(
+        'land_ice_area_fraction')
+    np.testing.assert_array_equal(mask, [[0, 1], [1, 0]])
+    monkeypatch.setattr(hyoga.config, 'glacier_masking_point', 3.0)
+    mask = ds.hyoga.assign(land_ice_area_fraction=path).hyoga.getvar(
+        'land_ice_area_fraction')
+    np.testing.assert_array_equal(mask, [[0, 0], [1, 0]])
+
+
+def test_assign_path_large(tmp_path, monkeypatch):
+    path = tmp_path / 'thk.nc'
+    make_dataset().to_netcdf(path)
+    monkeypatch.setattr(hyoga.core.accessor, '_DATASOURCE_CACHE_NBYTES', 0)
+    thk = hyoga.core.accessor._open_datasource(path, 'land_ice_thickness')
+    assert not thk.variable._in_memory
+    np.testing.assert_array_equal(thk, make_dataset().thk)
+    assert hyoga.core.accessor._load_datasource(
+        str(path), path.stat().st_mtime, 'land_ice_thickness') is None
+
+
+def test_getvar_inferred_copy():
+    ds = make_dataset()
+    mask = ds.hyoga.getvar('land_ice_area_fraction')
+    mask *= 0
+    mask.attrs.update(units='1')
+    mask = ds.hyoga.getvar('land_ice_area_fraction')
+    np.testing.assert_array_equal(mask, [[0, 1], [1, 0]])
+    assert 'units' not in mask.attrs
+
+
+def test_init_decode_encoded():
+    ds = make_dataset().assign(h=(
+        ['y', 'x'], np.array([[1, 4], [10, 0]], dtype='int16'),
+        {'standard_name': 'land_ice_thickness', 'scale_factor': 0.5}))
+    ds = ds.drop_vars('thk')
+    np.testing.assert_array_equal(ds.hyoga.getvar('land_ice_thickness'), (
+        make_dataset().thk))
+    assert ds.h.attrs['scale_factor'] == 0.5
+
+
+def test_init_decode_timedelta():
+    ds = make_dataset().assign(t=((), 1, {'units': 'days'}))
+    assert ds.hyoga._ds is not ds
+    assert ds.t.attrs == {'units': 'days'}
+
+
+def test_init_decoded():
+    ds = make_dataset()
+    attrs = {name: dict(var.attrs) for name, var in ds.variables.items()}
+    assert ds.hyoga._ds is ds
+    assert {name: var.attrs for name, var in ds.variables.items()} == attrs
+
+
+def test_interp_same_grid():
+    ds = make_dataset().assign(
+        topg=(['y', 'x'], np.array([[100., 0], [50, 10]]),
+              {'standard_name': 'bedrock_altitude'}),
+        n=(['y', 'x'], np.ones((2, 2), dtype='int16')))
+    same = ds.hyoga.interp(ds.topg)
+    near = ds.hyoga.interp(ds.topg.assign_coords(
+        x=ds.x*(1-1e-12), y=ds.y*(1-1e-12)))
+    for name, var in same.data_vars.items():
+        assert var.dtype == near[name].dtype
+        np.testing.assert_allclose(var, near[name], atol=1e-9)
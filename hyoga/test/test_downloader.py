@@ -0,0 +1,146 @@
+# Copyright (c) 2024, Julien Seguinot (juseg.dev)
+# GNU General Public License v3.0+ (https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+This module contains basic tests for resumable downloads, using a mock session
+instead of the network.
+"""
+
+import io
+import zipfile
+import pytest
+import requests
+import hyoga.open.downloader
+
+
+class MockResponse:
+    """Minimal streamed response supporting the context manager protocol."""
+
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def iter_content(self, chunk_size=1):
+        """Yield content in chunks."""
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start+chunk_size]
+
+    def raise_for_status(self):
+        """Raise an error for error status codes."""
+        if self.status_code >= 400:
+            raise requests.HTTPError(self.status_code)
+
+
+class MockSession(requests.Session):
+    """Serve a single file with range requests and record request headers."""
+
+    def __init__(self, content, etag='"v1"'):
+        super().__init__()
+        self.content = content
+        self.etag = etag
+        self.requests = []
+
+    def get(self, url, headers=None, **kwargs):
+        """Return a full, partial or unsatisfiable range response."""
+        # pylint: disable=arguments-differ,unused-argument
+        headers = headers or {}
+        self.requests.append(headers)
+        etag = {'ETag': self.etag}
+        if 'Range' not in headers or headers.get('If-Range', self.etag) != (
+                self.etag):
+            return MockResponse(200, self.content, etag)
+        offset = int(headers['Range'][6:-1])
+        if offset >= len(self.content):
+            return MockResponse(416, headers=etag)
+        return MockResponse(206, self.content[offset:], etag)
+
+
+@pytest.fixture(name='session')
+def fixture_session(monkeypatch):
+    """Patch the downloader session with a mock session."""
+    session = MockSession(b'0123456789')
+    monkeypatch.setattr(
+        hyoga.open.downloader, '_get_session', lambda: session)
+    return session
+
+
+def test_download(session, tmp_path):
+    path = str(tmp_path / 'file')
+    hyoga.open.downloader.Downloader()('url', path)
+    assert open(path, 'rb').read() == session.content
+    assert session.requests == [{'Accept-Encoding': 'identity'}]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['file']
+
+
+def test_download_resume(session, tmp_path):
+    path = str(tmp_path / 'file')
+    open(path + '.part', 'wb').write(b'0123')
+    open(path + '.part.validator', 'w', encoding='utf-8').write('"v1"')
+    hyoga.open.downloader.Downloader()('url', path)
+    assert open(path, 'rb').read() == session.content
+    assert session.requests == [{
+        'Accept-Encoding': 'identity', 'Range': 'bytes=4-',
+        'If-Range': '"v1"'}]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['file']
+
+
+def test_download_resume_changed(session, tmp_path):
+    path = str(tmp_path / 'file')
+    open(path + '.part', 'wb').write(b'abcd')
+    open(path + '.part.validator', 'w', encoding='utf-8').write('"v0"')
+    hyoga.open.downloader.Downloader()('url', path)
+    assert open(path, 'rb').read() == session.content
+    assert len(session.requests) == 1
+
+
+def test_download_resume_invalid(session, tmp_path):
+    path = str(tmp_path / 'file')
+    open(path + '.part', 'wb').write(b'0123456789abcd')
+    open(path + '.part.validator', 'w', encoding='utf-8').write('"v1"')
+    hyoga.open.downloader.Downloader()('url', path)
+    assert open(path, 'rb').read() == session.content
+    assert session.requests == [
+        {'Accept-Encoding': 'identity', 'Range': 'bytes=14-',
+         'If-Range': '"v1"'},
+        {'Accept-Encoding': 'identity'}]
+
+
+def test_download_resume_no_validator(session, tmp_path):
+    path = str(tmp_path / 'file')
+    open(path + '.part', 'wb').write(b'abcd')
+    hyoga.open.downloader.Downloader()('url', path)
+    assert open(path, 'rb').read() == session.content
+    assert session.requests == [{'Accept-Encoding': 'identity'}]
+
+
+def test_download_resume_invalid_archive(session, tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, 'w') as zipf:
+        zipf.writestr('member.txt', 'data')
+    session.content = archive.getvalue()
+    partpath = tmp_path / 'hyoga' / 'archive.zip.part'
+    partpath.parent.mkdir()
+    partpath.write_bytes(session.content + b'stale')
+    (partpath.parent / 'archive.zip.part.validator').write_text('"v1"')
+    path = hyoga.open.downloader.ZipDownloader()(
+        'https://example.com/archive.zip', 'member.txt')
+    assert open(path, encoding='utf-8').read() == 'data'
+    assert len(session.requests) == 2
+
+
+def test_download_map(session, tmp_path):
+    adapters = dict(session.adapters)
+    paths = hyoga.open.downloader.Downloader().map(
+        (('url', str(tmp_path / f'file{i}')) for i in range(16)),
+        max_workers=16)
+    assert paths == [str(tmp_path / f'file{i}') for i in range(16)]
+    assert len(session.requests) == 16
+    assert session.adapters == adapters
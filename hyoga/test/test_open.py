@@ -0,0 +1,55 @@
+# Copyright (c) 2024, Julien Seguinot (juseg.dev)
+# GNU General Public License v3.0+ (https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+This module contains basic tests for opening local files.
+"""
+
+import numpy as np
+import pytest
+import xarray as xr
+import hyoga
+import hyoga.open.local
+
+
+def make_file(path):
+    """Write a minimal model output file with a time dimension."""
+    ds = xr.Dataset(
+        coords={
+            'time': ('time', [0., 3.1536e10], {'units': 'seconds'}),
+            'x': [0., 1., 2.], 'y': [0., 1.]},
+        data_vars={
+            'thk': (['time', 'y', 'x'], np.arange(12.).reshape(2, 2, 3), {
+                'standard_name': 'land_ice_thickness'}),
+            'topg': (['y', 'x'], np.zeros((2, 3)), {
+                'standard_name': 'bedrock_altitude'})},
+        attrs={'history': 'run'})
+    ds.to_netcdf(path)
+    return str(path)
+
+
+def open_mfdataset(filename, **kwargs):
+    """Open files with xarray using mfdataset defaults for comparison."""
+    options = dict(
+        attrs_file=filename if isinstance(filename, str) else filename[-1],
+        chunks={'time': 1}, data_vars='minimal', coords='minimal',
+        compat='override', decode_cf=False, parallel=True)
+    options.update(**kwargs)
+    return hyoga.open.local._preprocess(xr.open_mfdataset(filename, **options))
+
+
+@pytest.mark.parametrize('kwargs', [
+    {}, {'chunks': None}, {'chunks': {'time': 2}},
+    {'combine': 'nested', 'concat_dim': 'run', 'compat': 'equals',
+     'coords': 'different'},
+    {'combine_attrs': 'drop_conflicts'},
+    {'preprocess': lambda ds: ds.drop_vars('topg')}])
+@pytest.mark.parametrize('aslist', [False, True])
+def test_mfdataset_single(tmp_path, kwargs, aslist):
+    path = make_file(tmp_path / 'ex.nc')
+    filename = [path] if aslist else path
+    ds = hyoga.open.mfdataset(filename, **kwargs)
+    expected = open_mfdataset(filename, **kwargs)
+    xr.testing.assert_identical(ds, expected)
+    for name, var in ds.variables.items():
+        assert var.chunks == expected[name].chunks